@@ -7,12 +7,18 @@ See documentation in docs/topics/extensions.rst
 from __future__ import annotations
 
 import logging
+import os
 import socket
 import sys
-from importlib import import_module
 from pprint import pformat
 from typing import TYPE_CHECKING
 
+try:
+    # stdlib's resource module is only available on unix platforms.
+    import resource as _resource
+except ImportError:
+    _resource = None  # type: ignore[assignment]
+
 from scrapy import signals
 from scrapy.exceptions import NotConfigured
 from scrapy.mail import MailSender
@@ -35,21 +41,51 @@ class MemoryUsage:
     def __init__(self, crawler: Crawler):
         if not crawler.settings.getbool("MEMUSAGE_ENABLED"):
             raise NotConfigured
-        try:
-            # stdlib's resource module is only available on unix platforms.
-            self.resource = import_module("resource")
-        except ImportError:
+        if _resource is None:
             raise NotConfigured
 
         self.crawler: Crawler = crawler
         self.warned: bool = False
+        # Only report memory usage when it has moved by at least this many
+        # bytes (~10MiB, prime to avoid aliasing with allocator sizes) since
+        # the last report, to keep logging quiet in steady state.
+        self._last_size: int = 0
+        self._delta_threshold: int = 10_000_019
+        # Local high-water mark mirroring memusage/max, so the stats
+        # collector is only touched when a new maximum is seen.
+        self._local_max: int = 0
+        # On Linux read the current RSS from /proc/self/statm through a
+        # long-lived fd: one pread() per sample, and unlike ru_maxrss it
+        # reflects the current usage, not the peak.
+        self._statm_fd: int | None = None
+        if sys.platform.startswith("linux"):
+            try:
+                self._statm_fd = os.open("/proc/self/statm", os.O_RDONLY)
+                self._pagesize: int = os.sysconf("SC_PAGE_SIZE")
+            except OSError:
+                self._statm_fd = None
         self.notify_mails: list[str] = crawler.settings.getlist("MEMUSAGE_NOTIFY_MAIL")
         self.limit: int = crawler.settings.getint("MEMUSAGE_LIMIT_MB") * 1024 * 1024
         self.warning: int = crawler.settings.getint("MEMUSAGE_WARNING_MB") * 1024 * 1024
+        self._limit_mib: int = self.limit >> 20
+        self._warning_mib: int = self.warning >> 20
         self.check_interval: float = crawler.settings.getfloat(
             "MEMUSAGE_CHECK_INTERVAL_SECONDS"
         )
         self.mail: MailSender = MailSender.from_crawler(crawler)
+        # Neither the hostname nor the bot name change over the lifetime of
+        # the crawler, so resolve them (and the mail subjects built from
+        # them) once instead of on every notification.
+        self._hostname: str = socket.gethostname()
+        self._bot_name: str = crawler.settings["BOT_NAME"]
+        self._limit_subj_tmpl: str = (
+            f"{self._bot_name} terminated: "
+            f"memory usage exceeded {{}}MiB at {self._hostname}"
+        )
+        self._warning_subj_tmpl: str = (
+            f"{self._bot_name} warning: "
+            f"memory usage reached {{}}MiB at {self._hostname}"
+        )
         crawler.signals.connect(self.engine_started, signal=signals.engine_started)
         crawler.signals.connect(self.engine_stopped, signal=signals.engine_stopped)
 
@@ -58,7 +94,12 @@ class MemoryUsage:
         return cls(crawler)
 
     def get_virtual_size(self) -> int:
-        size: int = self.resource.getrusage(self.resource.RUSAGE_SELF).ru_maxrss
+        if self._statm_fd is not None:
+            buf = os.pread(self._statm_fd, 64, 0)
+            # the second field of /proc/self/statm is the resident set size
+            # in pages
+            return int(buf.split(b" ", 2)[1]) * self._pagesize
+        size: int = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
         if sys.platform != "darwin":
             # on macOS ru_maxrss is in bytes, on Linux it is in KB
             size *= 1024
@@ -67,94 +108,106 @@ class MemoryUsage:
     def engine_started(self) -> None:
         assert self.crawler.stats
         self.crawler.stats.set_value("memusage/startup", self.get_virtual_size())
-        self.tasks: list[AsyncioLoopingCall | LoopingCall] = []
-        tsk = create_looping_call(self.update)
-        self.tasks.append(tsk)
+        # Polling only serves the limit/warning checks and the notification
+        # mails; if none of them is configured, or polling is disabled via a
+        # zero interval, the startup stat is all there is to record.
+        needs_polling = bool(
+            self.check_interval and (self.limit or self.warning or self.notify_mails)
+        )
+        if not needs_polling:
+            self.tasks: list[AsyncioLoopingCall | LoopingCall] = []
+            return
+        tsk = create_looping_call(self._tick)
+        self.tasks = [tsk]
         tsk.start(self.check_interval, now=True)
-        if self.limit:
-            tsk = create_looping_call(self._check_limit)
-            self.tasks.append(tsk)
-            tsk.start(self.check_interval, now=True)
-        if self.warning:
-            tsk = create_looping_call(self._check_warning)
-            self.tasks.append(tsk)
-            tsk.start(self.check_interval, now=True)
 
     def engine_stopped(self) -> None:
         for tsk in self.tasks:
             if tsk.running:
                 tsk.stop()
+        if self._statm_fd is not None:
+            os.close(self._statm_fd)
+            self._statm_fd = None
+
+    def _tick(self) -> None:
+        # Sample the memory usage once and dispatch all the periodic checks
+        # from it, rather than measuring separately for each check. The
+        # instance attributes used on every tick are bound to locals up
+        # front to keep attribute lookups out of the hot body.
+        stats = self.crawler.stats
+        limit = self.limit
+        warning = self.warning
+        assert stats
+        size = self.get_virtual_size()
+        if size > self._local_max:
+            self._local_max = size
+            stats.max_value("memusage/max", size)
+        if limit:
+            if size > limit:
+                self._handle_limit(size)
+            elif abs(size - self._last_size) >= self._delta_threshold:
+                self._last_size = size
+                logger.info(
+                    "Peak memory usage is %(virtualsize)dMiB",
+                    {"virtualsize": size >> 20},
+                )
+        if warning and not self.warned and size > warning:
+            self._handle_warning(size)
 
-    def update(self) -> None:
-        assert self.crawler.stats
-        self.crawler.stats.max_value("memusage/max", self.get_virtual_size())
-
-    def _check_limit(self) -> None:
+    def _handle_limit(self, size: int) -> None:
         assert self.crawler.engine
         assert self.crawler.stats
-        peak_mem_usage = self.get_virtual_size()
-        if peak_mem_usage > self.limit:
-            self.crawler.stats.set_value("memusage/limit_reached", 1)
-            mem = self.limit / 1024 / 1024
-            logger.error(
-                "Memory usage exceeded %(memusage)dMiB. Shutting down Scrapy...",
-                {"memusage": mem},
-                extra={"crawler": self.crawler},
+        self.crawler.stats.set_value("memusage/limit_reached", 1)
+        mem = self._limit_mib
+        logger.error(
+            "Memory usage exceeded %(memusage)dMiB. Shutting down Scrapy...",
+            {"memusage": mem},
+            extra={"crawler": self.crawler},
+        )
+        if self.notify_mails:
+            subj = self._limit_subj_tmpl.format(mem)
+            self._send_report(self.notify_mails, subj, size)
+            self.crawler.stats.set_value("memusage/limit_notified", 1)
+
+        if self.crawler.engine.spider is not None:
+            self.crawler.engine.close_spider(
+                self.crawler.engine.spider, "memusage_exceeded"
             )
-            if self.notify_mails:
-                subj = (
-                    f"{self.crawler.settings['BOT_NAME']} terminated: "
-                    f"memory usage exceeded {mem}MiB at {socket.gethostname()}"
-                )
-                self._send_report(self.notify_mails, subj)
-                self.crawler.stats.set_value("memusage/limit_notified", 1)
-
-            if self.crawler.engine.spider is not None:
-                self.crawler.engine.close_spider(
-                    self.crawler.engine.spider, "memusage_exceeded"
-                )
-            else:
-                self.crawler.stop()
         else:
-            logger.info(
-                "Peak memory usage is %(virtualsize)dMiB",
-                {"virtualsize": peak_mem_usage / 1024 / 1024},
-            )
+            self.crawler.stop()
 
-    def _check_warning(self) -> None:
-        if self.warned:  # warn only once
-            return
+    def _handle_warning(self, size: int) -> None:
         assert self.crawler.stats
-        if self.get_virtual_size() > self.warning:
-            self.crawler.stats.set_value("memusage/warning_reached", 1)
-            mem = self.warning / 1024 / 1024
-            logger.warning(
-                "Memory usage reached %(memusage)dMiB",
-                {"memusage": mem},
-                extra={"crawler": self.crawler},
-            )
-            if self.notify_mails:
-                subj = (
-                    f"{self.crawler.settings['BOT_NAME']} warning: "
-                    f"memory usage reached {mem}MiB at {socket.gethostname()}"
-                )
-                self._send_report(self.notify_mails, subj)
-                self.crawler.stats.set_value("memusage/warning_notified", 1)
-            self.warned = True
+        self.crawler.stats.set_value("memusage/warning_reached", 1)
+        mem = self._warning_mib
+        logger.warning(
+            "Memory usage reached %(memusage)dMiB",
+            {"memusage": mem},
+            extra={"crawler": self.crawler},
+        )
+        if self.notify_mails:
+            subj = self._warning_subj_tmpl.format(mem)
+            self._send_report(self.notify_mails, subj, size)
+            self.crawler.stats.set_value("memusage/warning_notified", 1)
+        self.warned = True
 
-    def _send_report(self, rcpts: list[str], subject: str) -> None:
+    def _send_report(self, rcpts: list[str], subject: str, size: int) -> None:
         """send notification mail with some additional useful info"""
+        if not rcpts:
+            return
         assert self.crawler.engine
         assert self.crawler.stats
         stats = self.crawler.stats
-        s = f"Memory usage at engine startup : {stats.get_value('memusage/startup') / 1024 / 1024}M\r\n"
-        s += f"Maximum memory usage          : {stats.get_value('memusage/max') / 1024 / 1024}M\r\n"
-        s += f"Current memory usage          : {self.get_virtual_size() / 1024 / 1024}M\r\n"
-
-        s += (
-            "ENGINE STATUS ------------------------------------------------------- \r\n"
+        engine_status = pformat(get_engine_status(self.crawler.engine))
+        s = "".join(
+            [
+                f"Memory usage at engine startup : {stats.get_value('memusage/startup') / 1024 / 1024}M\r\n",
+                f"Maximum memory usage          : {stats.get_value('memusage/max') / 1024 / 1024}M\r\n",
+                f"Current memory usage          : {size / 1048576}M\r\n",
+                "ENGINE STATUS ------------------------------------------------------- \r\n",
+                "\r\n",
+                engine_status,
+                "\r\n",
+            ]
         )
-        s += "\r\n"
-        s += pformat(get_engine_status(self.crawler.engine))
-        s += "\r\n"
         self.mail.send(rcpts, subject, s)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import sys
 from contextlib import suppress
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from warnings import catch_warnings, filterwarnings
 
@@ -29,7 +30,7 @@ if TYPE_CHECKING:
 _T = TypeVar("_T")
 
 
-def listen_tcp(portrange: list[int], host: str, factory: ServerFactory) -> Port:  # type: ignore[return]  # pylint: disable=inconsistent-return-statements  # noqa: RET503
+def listen_tcp(portrange: list[int], host: str, factory: ServerFactory) -> Port:
     """Like reactor.listenTCP but tries different ports in a range."""
     from twisted.internet import reactor
 
@@ -39,12 +40,28 @@ def listen_tcp(portrange: list[int], host: str, factory: ServerFactory) -> Port:
         return reactor.listenTCP(0, factory, interface=host)
     if len(portrange) == 1:
         return reactor.listenTCP(portrange[0], factory, interface=host)
-    for x in range(portrange[0], portrange[1] + 1):
+    lo, hi = portrange
+    for x in range(lo, hi):
         try:
             return reactor.listenTCP(x, factory, interface=host)
         except error.CannotListenError:
-            if x == portrange[1]:
-                raise
+            continue
+    # the last port is tried outside the loop so its exception propagates
+    return reactor.listenTCP(hi, factory, interface=host)
+
+
+_call_later: Callable | None = None
+
+
+def _get_call_later() -> Callable:
+    """Resolve :func:`scrapy.utils.asyncio.call_later` once, caching it at
+    module level; importing it at module level would be a circular import."""
+    global _call_later  # noqa: PLW0603  # pylint: disable=global-statement
+    if _call_later is None:
+        from scrapy.utils.asyncio import call_later  # noqa: PLC0415
+
+        _call_later = call_later
+    return _call_later
 
 
 class CallLaterOnce(Generic[_T]):
@@ -60,8 +77,7 @@ class CallLaterOnce(Generic[_T]):
         self._deferreds: list[Deferred] = []
 
     def schedule(self, delay: float = 0) -> None:
-        # circular import
-        from scrapy.utils.asyncio import call_later  # noqa: PLC0415
+        call_later = _get_call_later()
 
         if self._call is None:
             self._call = call_later(delay, self)
@@ -71,18 +87,25 @@ class CallLaterOnce(Generic[_T]):
             self._call.cancel()
 
     def __call__(self) -> _T:
-        # circular import
-        from scrapy.utils.asyncio import call_later  # noqa: PLC0415
+        call_later = _get_call_later()
 
         self._call = None
         result = self._func(*self._a, **self._kw)
 
-        for d in self._deferreds:
-            call_later(0, d.callback, None)
-        self._deferreds = []
+        if self._deferreds:
+            # Fire all the waiting deferreds from a single scheduled call
+            # instead of scheduling one reactor call per deferred.
+            pending = self._deferreds
+            self._deferreds = []
+            call_later(0, self._fire_all, pending)
 
         return result
 
+    @staticmethod
+    def _fire_all(deferreds: list[Deferred]) -> None:
+        for d in deferreds:
+            d.callback(None)
+
     async def wait(self):
         # circular import
         from scrapy.utils.defer import maybe_deferred_to_future  # noqa: PLC0415
@@ -95,6 +118,13 @@ class CallLaterOnce(Generic[_T]):
 _asyncio_reactor_path = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 
 
+@lru_cache(maxsize=32)
+def _cached_load_object(path: str) -> Any:
+    """:func:`~scrapy.utils.misc.load_object` with a cache, for the reactor
+    and event loop paths that are resolved repeatedly during startup."""
+    return load_object(path)
+
+
 def set_asyncio_event_loop_policy() -> None:
     """The policy functions from asyncio often behave unexpectedly,
     so we restrict their use to the absolutely essential case.
@@ -112,7 +142,7 @@ def install_reactor(reactor_path: str, event_loop_path: str | None = None) -> No
     """Installs the :mod:`~twisted.internet.reactor` with the specified
     import path. Also installs the asyncio event loop with the specified import
     path if the asyncio reactor is enabled"""
-    reactor_class = load_object(reactor_path)
+    reactor_class = _cached_load_object(reactor_path)
     if reactor_class is asyncioreactor.AsyncioSelectorReactor:
         set_asyncio_event_loop_policy()
         with suppress(error.ReactorAlreadyInstalledError):
@@ -121,7 +151,7 @@ def install_reactor(reactor_path: str, event_loop_path: str | None = None) -> No
     else:
         *module, _ = reactor_path.split(".")
         installer_path = [*module, "install"]
-        installer = load_object(".".join(installer_path))
+        installer = _cached_load_object(".".join(installer_path))
         with suppress(error.ReactorAlreadyInstalledError):
             installer()
 
@@ -174,7 +204,7 @@ def verify_installed_reactor(reactor_path: str) -> None:
 
     from twisted.internet import reactor
 
-    expected_reactor_type = load_object(reactor_path)
+    expected_reactor_type = _cached_load_object(reactor_path)
     reactor_type = type(reactor)
     if not reactor_type == expected_reactor_type:
         raise RuntimeError(
@@ -194,7 +224,7 @@ def verify_installed_asyncio_event_loop(loop_path: str) -> None:
 
     from twisted.internet import reactor
 
-    loop_class = load_object(loop_path)
+    loop_class = _cached_load_object(loop_path)
     if isinstance(reactor._asyncioEventloop, loop_class):
         return
     installed = (
@@ -209,9 +239,20 @@ def verify_installed_asyncio_event_loop(loop_path: str) -> None:
     )
 
 
+_reactor_installed_cache = False
+
+
 def is_reactor_installed() -> bool:
     """Check whether a :mod:`~twisted.internet.reactor` is installed."""
-    return "twisted.internet.reactor" in sys.modules
+    global _reactor_installed_cache  # noqa: PLW0603  # pylint: disable=global-statement
+    if _reactor_installed_cache:
+        return True
+    if "twisted.internet.reactor" in sys.modules:
+        # A reactor is never uninstalled within a process, so a positive
+        # result can be cached to skip the sys.modules lookup.
+        _reactor_installed_cache = True
+        return True
+    return False
 
 
 def is_asyncio_reactor_installed() -> bool: